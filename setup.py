@@ -1,4 +1,6 @@
+import hashlib
 import os
+import platform
 import shutil
 import subprocess
 import sys
@@ -15,6 +17,189 @@ SCRIPTS = [
     "scripts/convert_ome_tiff",
 ]
 
+# Extra Nuitka flags per script. Nuitka follows imports transitively, so
+# without these the attach_to_notebook build drags the whole scientific stack
+# (reachable via jupyter_client extras) into the compile.
+SCRIPT_NUITKA_FLAGS = {
+    "attach_to_notebook": [
+        "--nofollow-import-to=numpy,scipy,sklearn,anndata,scanpy,pandas,"
+        "matplotlib,h5py,zarr,IPython,ipykernel.inprocess",
+        "--include-package=jupyter_client,click,rich",
+    ],
+}
+
+
+# Launcher installed in place of each script; the standalone dist tree lives in a
+# sibling directory so there is no onefile self-extraction on every run.
+_LAUNCHER_TEMPLATE = """\
+#!/bin/sh
+here="$(cd "$(dirname "$0")" && pwd)"
+exec "$here/{script_name}.dist/{script_name}.bin" "$@"
+"""
+
+# Compiled dist trees are cached here, keyed on script source + toolchain,
+# so unchanged scripts skip the (minutes-long) Nuitka compile entirely.
+_NUITKA_CACHE_ROOT = Path.home() / ".cache" / "single-cell-tools" / "nuitka"
+
+
+def _run_nuitka(args: list[str], env: dict) -> None:
+    """Run Nuitka's driver from this interpreter rather than a fresh one.
+
+    Forking keeps Nuitka's already-imported modules warm across the SCRIPTS
+    loop instead of paying a full interpreter + Nuitka bootstrap per script,
+    while still isolating the build from Nuitka's process-level behavior (it
+    may re-exec itself). Falls back to a subprocess where fork is unavailable.
+    """
+    if not hasattr(os, "fork"):
+        subprocess.run([sys.executable, "-m", "nuitka", *args], check=True, env=env)
+        return
+
+    from nuitka.__main__ import main as nuitka_main  # warm the import pre-fork
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: become the Nuitka driver.
+        code = 1
+        try:
+            os.environ.clear()
+            os.environ.update(env)
+            sys.argv = ["nuitka", *args]
+            nuitka_main()
+            code = 0
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        except BaseException:
+            pass
+        os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    code = os.waitstatus_to_exitcode(status)
+    if code != 0:
+        raise subprocess.CalledProcessError(code, ["nuitka", *args])
+
+
+def _nuitka_cache_key(script_path: Path, extra_flags: list[str], build_lib) -> str:
+    from importlib.metadata import version
+
+    digest = hashlib.sha256(
+        script_path.read_bytes()
+        + sys.version.encode()
+        + platform.platform().encode()
+        + version("nuitka").encode()
+        + "\0".join(extra_flags).encode()
+    )
+    # The dist embeds the whole package (Nuitka follows imports from
+    # build_lib), so the key must also cover the package sources — the
+    # wrapper scripts are stable shims and alone would let a cached binary
+    # with stale package code be reinstalled forever.
+    if build_lib:
+        for source in sorted(Path(build_lib).rglob("*.py")):
+            digest.update(str(source.relative_to(build_lib)).encode())
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _install_dist(build_dir: Path, script_name: str, dist_dir: Path) -> None:
+    """Copy a compiled dist tree into build_dir and swap in the launcher."""
+    install_dist = build_dir / f"{script_name}.dist"
+    if install_dist.exists():
+        shutil.rmtree(install_dist)
+    shutil.copytree(str(dist_dir), str(install_dist))
+    script_path = build_dir / script_name
+    script_path.write_text(_LAUNCHER_TEMPLATE.format(script_name=script_name))
+    os.chmod(script_path, 0o755)
+    os.chmod(install_dist / f"{script_name}.bin", 0o755)
+
+
+def _cache_dist(dist_dir: Path, cached_dist: Path) -> None:
+    """Deposit a freshly compiled dist tree into the on-disk cache."""
+    try:
+        cached_dist.parent.mkdir(parents=True, exist_ok=True)
+        if not cached_dist.exists():
+            shutil.copytree(str(dist_dir), str(cached_dist))
+    except OSError as exc:
+        # The cache is best-effort; a failed deposit only costs a recompile.
+        print(f"  Note: could not cache Nuitka build: {exc}")
+
+
+def _compile_one(script: str, build_dir: Path, build_lib) -> tuple[bool, str, str]:
+    """Compile one script to a standalone dist tree and install the launcher.
+
+    Runs in a worker process; returns (ok, script_name, message) so the build
+    command can report results in order. Every failure is reported through
+    the result tuple rather than raised — an exception escaping here would
+    abort the whole build instead of falling back to plain scripts.
+    """
+    script_name = Path(script).name
+    try:
+        return _compile_one_checked(script_name, build_dir, build_lib)
+    except Exception as exc:
+        return False, script_name, f"Nuitka compilation failed: {exc}"
+
+
+def _compile_one_checked(
+    script_name: str, build_dir: Path, build_lib
+) -> tuple[bool, str, str]:
+    script_path = build_dir / script_name
+
+    extra_flags = SCRIPT_NUITKA_FLAGS.get(script_name, [])
+    cache_key = _nuitka_cache_key(script_path, extra_flags, build_lib)
+    cached_dist = _NUITKA_CACHE_ROOT / cache_key / f"{script_name}.dist"
+
+    if cached_dist.is_dir():
+        _install_dist(build_dir, script_name, cached_dist)
+        return True, script_name, "reused cached Nuitka build"
+
+    print(f"Compiling {script_name} with Nuitka (--standalone) ...")
+
+    # Split cores across the concurrently-compiling scripts so Nuitka's own
+    # parallel C compilation doesn't oversubscribe the machine.
+    jobs = max(1, (os.cpu_count() or 1) // max(1, len(SCRIPTS)))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env = os.environ.copy()
+        if build_lib:
+            # Extend PYTHONPATH so Nuitka can import the freshly-built package.
+            env["PYTHONPATH"] = str(build_lib) + os.pathsep + env.get("PYTHONPATH", "")
+        # Persist Nuitka's intermediate cache so scripts (and later builds)
+        # reuse work such as already-compiled shared constants.
+        env["NUITKA_CACHE_DIR"] = str(_NUITKA_CACHE_ROOT / "nuitka-cache")
+
+        # Let ccache handle incremental C recompiles, and keep its object
+        # cache next to the dist cache so it survives tempdirs.
+        ccache = shutil.which("ccache")
+        if ccache:
+            env["NUITKA_CCACHE_BINARY"] = ccache
+            env.setdefault("CCACHE_DIR", str(_NUITKA_CACHE_ROOT / "ccache"))
+
+        cmd = [
+            "--standalone",
+            "--remove-output",
+            "--assume-yes-for-downloads",
+            # Parallel C compilation; LTO is pure cost for CLIs this small.
+            f"--jobs={jobs}",
+            "--lto=no",
+            f"--output-dir={tmpdir}",
+            f"--output-filename={script_name}.bin",
+            *extra_flags,
+            str(script_path),
+        ]
+
+        # Nuitka names the dist tree after the source file.
+        dist_dir = Path(tmpdir) / f"{script_name}.dist"
+
+        try:
+            _run_nuitka(cmd, env)
+        except (subprocess.CalledProcessError, OSError) as exc:
+            return False, script_name, f"Nuitka compilation failed: {exc}"
+
+        if not dist_dir.is_dir():
+            return False, script_name, "Nuitka finished but produced no dist tree"
+
+        _cache_dist(dist_dir, cached_dist)
+        _install_dist(build_dir, script_name, dist_dir)
+        return True, script_name, "compiled to standalone binary"
+
 
 class NuitkaBuild(_build):
     """build override: compiles wrapper scripts to standalone binaries via Nuitka.
@@ -22,11 +207,43 @@ class NuitkaBuild(_build):
     Hooks into the standard `build` command (which always exists in setuptools)
     rather than `build_scripts`, which is not present in all setuptools versions.
     Falls back to plain Python scripts if Nuitka is not installed or compilation fails.
+
+    Uses `--standalone` rather than `--onefile`: onefile binaries unpack their
+    payload to a temp dir on every run, which dominates startup for small CLIs.
+    The build places a `<script>.dist/` tree next to the installed script and
+    replaces the script with a thin shell launcher that exec's the binary inside.
     """
 
     def run(self):
         super().run()
+        # Editable/develop installs run the scripts straight from the source
+        # tree, so a minutes-long Nuitka compile would be thrown away.
+        # SCT_NO_NUITKA=1 lets users and CI opt out explicitly.
+        if (
+            os.environ.get("SCT_NO_NUITKA")
+            or "develop" in sys.argv
+            or "editable_wheel" in sys.argv
+        ):
+            print("Skipping Nuitka compilation (editable install or SCT_NO_NUITKA set).")
+            return
         self._try_nuitka_compile()
+        self._precompile_bytecode()
+
+    def _precompile_bytecode(self):
+        """Precompile the built package to bytecode.
+
+        The resulting __pycache__ directories ship in the wheel, so when the
+        Nuitka step fails or is skipped the plain-script fallback still avoids
+        the first-run bytecode compile. Level 0 is what a normal `python`
+        invocation actually loads; level 2 additionally strips docstrings for
+        users who run under -OO.
+        """
+        import compileall
+
+        build_py_cmd = self.get_finalized_command("build_py")
+        build_lib = getattr(build_py_cmd, "build_lib", None)
+        if build_lib and Path(build_lib).exists():
+            compileall.compile_dir(build_lib, optimize=[0, 2], quiet=1, workers=0)
 
     def _try_nuitka_compile(self):
         try:
@@ -38,6 +255,12 @@ class NuitkaBuild(_build):
             )
             return
 
+        if sys.platform == "win32":
+            # The shell launcher scheme below is POSIX-only.
+            print("Nuitka standalone build is not supported on Windows; "
+                  "scripts will be installed as plain Python scripts.")
+            return
+
         # Locate the directory where build_scripts placed the processed scripts.
         build_scripts_cmd = self.get_finalized_command("build_scripts")
         build_dir = Path(build_scripts_cmd.build_dir)
@@ -49,58 +272,39 @@ class NuitkaBuild(_build):
         build_py_cmd = self.get_finalized_command("build_py")
         build_lib = getattr(build_py_cmd, "build_lib", None)
 
-        for script in SCRIPTS:
-            script_name = Path(script).name
-            script_path = build_dir / script_name
-
-            if not script_path.exists():
-                continue
-
-            print(f"Compiling {script_name} with Nuitka (--onefile) ...")
+        scripts = [s for s in SCRIPTS if (build_dir / Path(s).name).exists()]
+        if not scripts:
+            return
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                # Name the output explicitly; Nuitka adds .exe on Windows automatically.
-                output_name = script_name + (".exe" if sys.platform == "win32" else "")
-                output_path = Path(tmpdir) / output_name
+        # The compiles are independent and CPU-bound, so run them across a
+        # process pool. The fork context is required: workers must inherit
+        # this process rather than re-importing setup.py under spawn.
+        if hasattr(os, "fork") and len(scripts) > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            from functools import partial
 
-                env = os.environ.copy()
-                if build_lib:
-                    env["PYTHONPATH"] = (
-                        str(build_lib) + os.pathsep + env.get("PYTHONPATH", "")
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(
+                max_workers=min(len(scripts), os.cpu_count() or 1), mp_context=ctx
+            ) as ex:
+                results = list(
+                    ex.map(
+                        partial(_compile_one, build_dir=build_dir, build_lib=build_lib),
+                        scripts,
                     )
+                )
+        else:
+            results = [_compile_one(s, build_dir, build_lib) for s in scripts]
 
-                cmd = [
-                    sys.executable,
-                    "-m",
-                    "nuitka",
-                    "--onefile",
-                    "--assume-yes-for-downloads",
-                    f"--output-dir={tmpdir}",
-                    "-o",
-                    str(output_path),
-                    str(script_path),
-                ]
-
-                try:
-                    subprocess.run(cmd, check=True, env=env)
-
-                    if output_path.exists():
-                        script_path.unlink()
-                        shutil.copy2(str(output_path), str(script_path))
-                        if sys.platform != "win32":
-                            os.chmod(script_path, 0o755)
-                        print(f"  OK: {script_name} compiled to native binary.")
-                    else:
-                        print(
-                            f"  Warning: Nuitka finished but produced no output for "
-                            f"{script_name}. Keeping Python script."
-                        )
-
-                except (subprocess.CalledProcessError, OSError) as exc:
-                    print(
-                        f"  Warning: Nuitka compilation failed for {script_name}: {exc}\n"
-                        f"  Keeping plain Python script as fallback."
-                    )
+        for ok, script_name, message in results:
+            if ok:
+                print(f"  OK: {script_name}: {message}")
+            else:
+                print(
+                    f"  Warning: {script_name}: {message}\n"
+                    f"  Keeping plain Python script as fallback."
+                )
 
 
 setup(
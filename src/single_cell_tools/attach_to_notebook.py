@@ -1,15 +1,213 @@
-import glob
+from __future__ import annotations
+
+import functools
+import http.client
 import json
 import os
-import urllib.error
-import urllib.request
+import threading
+import time
+from queue import Empty
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console, Group
-from rich.live import Live
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.text import Text
+
+# Prefer jiter, then orjson, then stdlib json: the Rust parsers are several
+# times faster on large payloads (notebooks with embedded images, busy
+# servers' session lists), and jiter's partial mode additionally tolerates a
+# notebook Jupyter is mid-way through writing to disk.
+try:
+    from jiter import from_json as _jiter_from_json
+
+    def _loads(data):
+        if isinstance(data, str):
+            data = data.encode()
+        return _jiter_from_json(bytes(data), partial_mode="trailing-strings")
+except ImportError:
+    try:
+        from orjson import loads as _loads
+    except ImportError:
+        _loads = json.loads
+
+try:
+    # ijson lets the notebook loader stream cells off disk without ever
+    # materializing the full document (see _load_notebook_streaming).
+    import ijson
+except ImportError:
+    ijson = None
+
+# rich is imported lazily inside the functions that render with it: the heavy
+# imports would otherwise dominate startup latency before the first kernel
+# message (and before --help output).
+if TYPE_CHECKING:
+    from rich.console import Console, Group
+    from rich.style import Style
+    from rich.text import Text
+
+
+# Keep-alive connections to Jupyter servers, pooled per thread (the probe
+# fan-out runs in a thread pool and http.client connections are not
+# thread-safe). Reusing the socket avoids a TCP handshake per request.
+_http_local = threading.local()
+
+
+def _http_get(url: str, token: str, timeout: float = 3) -> bytes:
+    """GET a Jupyter API URL over a pooled keep-alive connection."""
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    conns = getattr(_http_local, "conns", None)
+    if conns is None:
+        conns = _http_local.conns = {}
+    conn = conns.get(key)
+    if conn is None:
+        conn_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        conn = conn_cls(parts.netloc, timeout=timeout)
+        conns[key] = conn
+
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    try:
+        conn.request("GET", path, headers={"Authorization": f"token {token}"})
+        resp = conn.getresponse()
+        body = resp.read()
+    except Exception:
+        # A broken connection must not poison the pool.
+        conns.pop(key, None)
+        conn.close()
+        raise
+    if resp.status != 200:
+        raise OSError(f"GET {url} returned HTTP {resp.status}")
+    return body
+
+
+def _close_http_conns() -> None:
+    """Close this thread's pooled connections."""
+    conns = getattr(_http_local, "conns", None)
+    if conns:
+        for conn in conns.values():
+            conn.close()
+        conns.clear()
+
+
+# Remembers which kernel a notebook resolved to so repeat attaches can skip
+# the full server scan after one quick liveness check.
+_SESSION_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "single-cell-tools", "sessions.json"
+)
+
+
+def _check_cached_session(abs_notebook: str) -> tuple[str, str] | None:
+    """
+    Return (connection_file, execution_state) from the on-disk session cache
+    if the cached kernel for this notebook is still alive, else None.
+    """
+    try:
+        with open(_SESSION_CACHE_FILE, "rb") as f:
+            entry = _loads(f.read()).get(abs_notebook)
+        if not entry:
+            return None
+
+        connection_file = entry["connection_file"]
+        if not os.path.exists(connection_file):
+            return None
+
+        # One fast request against the remembered server confirms the kernel
+        # still exists (and gives us its current execution state).
+        kernel = _loads(
+            _http_get(
+                f"{entry['server_url'].rstrip('/')}/api/kernels/{entry['kernel_id']}",
+                entry.get("token", ""),
+                timeout=1,
+            )
+        )
+
+        click.echo(f"Kernel ID: {entry['kernel_id']} (cached)")
+        return connection_file, kernel.get("execution_state", "idle")
+    except Exception:
+        return None
+
+
+def _save_cached_session(
+    abs_notebook: str, kernel_id: str, connection_file: str, server_url: str, token: str
+) -> None:
+    """Record a successful notebook→kernel resolution; best-effort."""
+    try:
+        try:
+            with open(_SESSION_CACHE_FILE, "rb") as f:
+                cache = _loads(f.read())
+        except OSError:
+            cache = {}
+        cache[abs_notebook] = {
+            "kernel_id": kernel_id,
+            "connection_file": connection_file,
+            "server_url": server_url,
+            "token": token,
+            "ts": time.time(),
+        }
+        os.makedirs(os.path.dirname(_SESSION_CACHE_FILE), exist_ok=True)
+        # The cache holds the server token (full code execution on the
+        # kernel), so create it 0600 like Jupyter's own runtime files.
+        fd = os.open(
+            _SESSION_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+    except Exception:
+        pass
+
+
+def _probe_server(server_file: str, notebook_basename: str = "") -> tuple[dict, list] | None:
+    """
+    Read one server-*.json and fetch that server's /api/sessions list.
+    Returns (server_info, sessions) or None if the server is unreachable
+    or demonstrably doesn't host the notebook.
+    """
+    try:
+        with open(server_file, "rb") as f:
+            server_info = _loads(f.read())
+
+        url = server_info.get("url", "").rstrip("/")
+        token = server_info.get("token", "")
+        if not url:
+            return None
+
+        # Jupyter leaves server-*.json behind after unclean shutdowns, and a
+        # dead server means the HTTP probe below can only burn its timeout.
+        # Signal 0 checks process existence without delivering anything.
+        pid = server_info.get("pid")
+        if isinstance(pid, int):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return None
+            except OSError:
+                pass  # e.g. EPERM: the process exists but isn't ours.
+
+        raw = _http_get(f"{url}/api/sessions", token)
+
+        # A sessions payload that never mentions the notebook's filename
+        # can't contain it; the cheap substring test skips the JSON parse.
+        # jupyter-server emits ASCII-escaped JSON, so non-ASCII (or "/\\)
+        # names appear as \uXXXX sequences and must not be prefiltered.
+        if (
+            notebook_basename
+            and notebook_basename.isascii()
+            and '"' not in notebook_basename
+            and "\\" not in notebook_basename
+            and notebook_basename.encode() not in raw
+        ):
+            return None
+
+        sessions = _loads(raw)
+
+        return server_info, sessions
+    except Exception:
+        return None
 
 
 def _find_kernel_connection_file(notebook_path: str) -> tuple[str, str] | None:
@@ -27,58 +225,201 @@ def _find_kernel_connection_file(notebook_path: str) -> tuple[str, str] | None:
     runtime_dir = jupyter_runtime_dir()
     abs_notebook = os.path.abspath(notebook_path)
 
+    cached = _check_cached_session(abs_notebook)
+    if cached is not None:
+        return cached
+
     # Jupyter writes one *server-<pid>.json per running server instance.
-    server_files = sorted(
-        glob.glob(os.path.join(runtime_dir, "*server-*.json")),
-        key=os.path.getmtime,
-        reverse=True,
-    )
+    # os.scandir caches the stat result on each entry, so this is one syscall
+    # per file instead of the two that glob + os.path.getmtime would make.
+    try:
+        with os.scandir(runtime_dir) as it:
+            entries = [
+                (e.stat().st_mtime, e.path)
+                for e in it
+                if e.is_file() and "server-" in e.name and e.name.endswith(".json")
+            ]
+    except OSError:
+        return None
+    entries.sort(reverse=True)
+    server_files = [path for _, path in entries]
+    if not server_files:
+        return None
 
-    for server_file in server_files:
-        try:
-            with open(server_file) as f:
-                server_info = json.load(f)
+    # Probing is network-bound with a 3 s timeout per server, so stale server
+    # files would otherwise serialize into multi-second waits. Probe them all
+    # concurrently; results come back in order, newest server first.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(server_files))) as ex:
+        probed = ex.map(
+            functools.partial(
+                _probe_server, notebook_basename=os.path.basename(abs_notebook)
+            ),
+            server_files,
+        )
 
-            url = server_info.get("url", "").rstrip("/")
-            token = server_info.get("token", "")
-            if not url:
+        for result in probed:
+            if result is None:
                 continue
-
-            req = urllib.request.Request(
-                f"{url}/api/sessions",
-                headers={"Authorization": f"token {token}"},
-            )
-            with urllib.request.urlopen(req, timeout=3) as resp:
-                sessions = json.loads(resp.read())
+            server_info, sessions = result
 
             root_dir = server_info.get("root_dir") or server_info.get("notebook_dir", "")
-
-            for session in sessions:
-                session_abs = os.path.abspath(
-                    os.path.join(root_dir, session.get("path", ""))
+            # Resolve the root once; per-session paths then only need
+            # normpath (no getcwd syscall per session), and the match
+            # becomes a single dict lookup.
+            root_abs = os.path.abspath(root_dir)
+            paths = {
+                os.path.normpath(os.path.join(root_abs, s.get("path", ""))): s
+                for s in sessions
+            }
+
+            session = paths.get(abs_notebook)
+            if session is not None:
+                kernel = session["kernel"]
+                kernel_id = kernel["id"]
+                execution_state = kernel.get("execution_state", "idle")
+                click.echo(f"Kernel ID: {kernel_id}")
+                connection_file = find_connection_file(kernel_id)
+                _save_cached_session(
+                    abs_notebook,
+                    kernel_id,
+                    connection_file,
+                    server_info.get("url", ""),
+                    server_info.get("token", ""),
                 )
-                if session_abs == abs_notebook:
-                    kernel = session["kernel"]
-                    kernel_id = kernel["id"]
-                    execution_state = kernel.get("execution_state", "idle")
-                    click.echo(f"Kernel ID: {kernel_id}")
-                    return find_connection_file(kernel_id), execution_state
-
-        except Exception:
-            continue
+                return connection_file, execution_state
 
     return None
 
 
-def _notebook_cell_stats(notebook_path: str) -> tuple[int, int, str]:
+# Output data keys the renderer actually consumes; everything else — notably
+# multi-megabyte base64 image payloads — is dropped at load time.
+_RENDERED_DATA_KEYS = ("text/plain", "text/html")
+
+
+def _prune_notebook(nb: dict) -> dict:
+    """Keep only the cell fields the helpers read, freeing image blobs."""
+    pruned_cells = []
+    for cell in nb.get("cells", []):
+        pruned = {
+            "cell_type": cell.get("cell_type", ""),
+            "execution_count": cell.get("execution_count"),
+            "source": cell.get("source", ""),
+            "outputs": [],
+        }
+        for output in cell.get("outputs", []):
+            slim = {"output_type": output.get("output_type", "")}
+            if "text" in output:
+                slim["text"] = output["text"]
+            if "traceback" in output:
+                slim["traceback"] = output["traceback"]
+            data = output.get("data")
+            if isinstance(data, dict):
+                slim["data"] = {k: data[k] for k in _RENDERED_DATA_KEYS if k in data}
+            pruned["outputs"].append(slim)
+        pruned_cells.append(pruned)
+    return {"cells": pruned_cells, "metadata": nb.get("metadata", {})}
+
+
+def _load_notebook_streaming(f) -> dict:
+    """
+    Stream-parse a notebook with ijson, building the same pruned shape as
+    _prune_notebook without ever holding the full document (or its base64
+    image payloads) in memory.
+    """
+    nb: dict = {"cells": [], "metadata": {"kernelspec": {}}}
+    cell: dict | None = None
+    output: dict | None = None
+    data_prefix = "cells.item.outputs.item.data."
+
+    for prefix, event, value in ijson.parse(f):
+        if prefix == "metadata.kernelspec.language":
+            nb["metadata"]["kernelspec"]["language"] = value
+        elif prefix == "cells.item":
+            if event == "start_map":
+                cell = {
+                    "cell_type": "",
+                    "execution_count": None,
+                    "source": [],
+                    "outputs": [],
+                }
+            elif event == "end_map":
+                nb["cells"].append(cell)
+                cell = None
+        elif cell is None:
+            continue
+        elif prefix == "cells.item.cell_type":
+            cell["cell_type"] = value
+        elif prefix == "cells.item.execution_count" and event == "number":
+            cell["execution_count"] = int(value)
+        elif prefix in ("cells.item.source", "cells.item.source.item") and event == "string":
+            cell["source"].append(value)
+        elif prefix == "cells.item.outputs.item":
+            if event == "start_map":
+                output = {"output_type": ""}
+            elif event == "end_map":
+                cell["outputs"].append(output)
+                output = None
+        elif output is None:
+            continue
+        elif prefix == "cells.item.outputs.item.output_type":
+            output["output_type"] = value
+        elif prefix in ("cells.item.outputs.item.text", "cells.item.outputs.item.text.item") and event == "string":
+            output.setdefault("text", []).append(value)
+        elif prefix == "cells.item.outputs.item.traceback.item":
+            output.setdefault("traceback", []).append(value)
+        elif prefix.startswith(data_prefix) and event == "string":
+            key = prefix[len(data_prefix):].removesuffix(".item")
+            if key in _RENDERED_DATA_KEYS:
+                output.setdefault("data", {}).setdefault(key, []).append(value)
+
+    return nb
+
+
+def _load_notebook(notebook_path: str) -> dict:
+    """
+    Parse the notebook file once; the parsed dict is shared by all helpers so
+    multi-megabyte .ipynb files are read and decoded a single time per attach.
+    Image payloads are stripped during loading since nothing renders them.
+    Returns an empty dict if the file cannot be read or parsed.
+    """
+    try:
+        with open(notebook_path, "rb") as f:
+            if ijson is not None:
+                return _load_notebook_streaming(f)
+            return _prune_notebook(_loads(f.read()))
+    except Exception:
+        return {}
+
+
+# Parse-once cache: (st_mtime_ns, st_size) → pruned dict, so repeated loads of
+# an unchanged notebook are free.
+_NB_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_notebook_cached(notebook_path: str) -> dict:
+    """Like _load_notebook, but skips re-parsing while the file is unchanged."""
+    try:
+        st = os.stat(notebook_path)
+    except OSError:
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _NB_CACHE.get(notebook_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    nb = _load_notebook(notebook_path)
+    _NB_CACHE[notebook_path] = (key, nb)
+    return nb
+
+
+def _notebook_cell_stats(nb: dict) -> tuple[int, int, str]:
     """
-    Return (total_code_cells, max_execution_count, kernel_language) from the notebook file.
+    Return (total_code_cells, max_execution_count, kernel_language) from a parsed notebook.
     max_execution_count reflects how many cell executions have occurred so far.
     kernel_language is the Pygments lexer name (e.g. "python" or "r").
     """
     try:
-        with open(notebook_path) as f:
-            nb = json.load(f)
         code_cells = [c for c in nb.get("cells", []) if c.get("cell_type") == "code"]
         total = len(code_cells)
         max_ec = max(
@@ -91,21 +432,41 @@ def _notebook_cell_stats(notebook_path: str) -> tuple[int, int, str]:
         return 0, 0, "python"
 
 
+# markdownify's converter (and the BeautifulSoup machinery behind it) is set
+# up once and reused across outputs; initialization is deferred to the first
+# HTML output so bs4 stays off the CLI startup path.
+_md_convert = None
+_md_unavailable = False
+
+
+def _get_md_converter():
+    global _md_convert, _md_unavailable
+    if _md_convert is None and not _md_unavailable:
+        try:
+            from markdownify import MarkdownConverter
+
+            _md_convert = MarkdownConverter(heading_style="ATX").convert
+        except ImportError:
+            _md_unavailable = True
+    return _md_convert
+
+
 def _print_rich_output(console: Console, data: dict) -> None:
     """
     Render a Jupyter output data bundle, preferring HTML (via markdownify) over plain text.
     """
     html = data.get("text/html", "")
     if html:
-        try:
-            from markdownify import markdownify
+        convert = _get_md_converter()
+        if convert is not None:
             from rich.markdown import Markdown
-            md = markdownify(html, heading_style="ATX").strip()
+
+            if isinstance(html, list):
+                html = "".join(html)
+            md = convert(html).strip()
             if md:
                 console.print(Markdown(md))
                 return
-        except ImportError:
-            pass
 
     text = data.get("text/plain", "")
     if isinstance(text, list):
@@ -114,24 +475,37 @@ def _print_rich_output(console: Console, data: dict) -> None:
         console.print(text, markup=False)
 
 
+@functools.lru_cache(maxsize=128)
+def _render_code_panel(code: str, language: str, ec_str: str):
+    """
+    Build the syntax-highlighted panel for a cell.  Memoized: notebook cells
+    are commonly re-run with identical source, and a cache hit skips the
+    Pygments lexing entirely.
+    """
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    return Panel(
+        Syntax(code, language, theme="monokai", word_wrap=True),
+        title=f"[dim]In [{ec_str}][/dim]",
+        title_align="left",
+        border_style="dim",
+        padding=(0, 1),
+    )
+
+
 def _print_code_block(console: Console, code: str | list, execution_count: int | str, language: str) -> None:
     """Render a syntax-highlighted code block with execution count as title."""
     if isinstance(code, list):
         code = "".join(code)
     if not code.strip():
         return
-    console.print(Panel(
-        Syntax(code, language, theme="monokai", word_wrap=True),
-        title=f"[dim]In [{execution_count}][/dim]",
-        title_align="left",
-        border_style="dim",
-        padding=(0, 1),
-    ))
+    console.print(_render_code_panel(code, language, str(execution_count)))
 
 
-def _find_likely_executing_cell(notebook_path: str) -> tuple[str, list, int | str] | None:
+def _find_likely_executing_cell(nb: dict) -> tuple[str, list, int | str] | None:
     """
-    Scan the notebook to find the cell most likely currently executing.
+    Scan the parsed notebook to find the cell most likely currently executing.
 
     Key insight: Jupyter writes streaming outputs to disk BEFORE setting
     execution_count (which is only written on cell completion).  So:
@@ -143,29 +517,38 @@ def _find_likely_executing_cell(notebook_path: str) -> tuple[str, list, int | st
                 (for when the executing cell has produced no output yet).
     Returns (source, outputs, execution_count) or None.
     """
-    try:
-        with open(notebook_path) as f:
-            nb = json.load(f)
-    except Exception:
-        return None
-
-    cells = [c for c in nb.get("cells", []) if c.get("cell_type") == "code"]
+    # One pass over the cells collects everything both strategies need
+    # (best in-progress candidate, highest execution_count and its position)
+    # instead of building intermediate lists and re-scanning per strategy.
+    cells = []
+    in_progress = None
+    in_progress_outputs = -1
+    max_ec = 0
+    last_max_idx = -1
+    for cell in nb.get("cells", []):
+        if cell.get("cell_type") != "code":
+            continue
+        cells.append(cell)
+        ec = cell.get("execution_count") or 0
+        if ec >= max_ec and ec > 0:
+            max_ec = ec
+            last_max_idx = len(cells) - 1
+        elif not ec and cell.get("outputs") and len(cell["outputs"]) > in_progress_outputs:
+            in_progress = cell
+            in_progress_outputs = len(cell["outputs"])
     if not cells:
         return None
 
     # Strategy A: has outputs but no execution_count — Jupyter streams output
     # before the execution_count is finalized on disk.
-    in_progress = [c for c in cells if c.get("outputs") and not c.get("execution_count")]
-    if in_progress:
-        candidate = max(in_progress, key=lambda c: len(c.get("outputs", [])))
-        source = candidate.get("source", "")
+    if in_progress is not None:
+        source = in_progress.get("source", "")
         if isinstance(source, list):
             source = "".join(source)
-        return source, candidate.get("outputs", []), "..."
+        return source, in_progress.get("outputs", []), "..."
 
     # Strategy B: cell positionally after the one with the highest execution_count.
     # Avoids off-by-one from no-output cells (e.g. `x = 5`).
-    max_ec = max((c.get("execution_count") or 0 for c in cells), default=0)
     if max_ec == 0:
         # Nothing completed yet; first cell is probably executing.
         candidate = cells[0]
@@ -173,11 +556,6 @@ def _find_likely_executing_cell(notebook_path: str) -> tuple[str, list, int | st
         if isinstance(source, list):
             source = "".join(source)
         return source, [], "?"
-
-    last_max_idx = max(
-        (i for i, c in enumerate(cells) if (c.get("execution_count") or 0) == max_ec),
-        default=-1,
-    )
     if last_max_idx + 1 < len(cells):
         candidate = cells[last_max_idx + 1]
         source = candidate.get("source", "")
@@ -188,67 +566,84 @@ def _find_likely_executing_cell(notebook_path: str) -> tuple[str, list, int | st
     return None
 
 
+def _print_outputs(console: Console, outputs: list) -> None:
+    """Print a cell's outputs, coalescing consecutive stream outputs.
+
+    Stream text is accumulated and written with a single console.print call
+    per run rather than one per output, which skips the per-call render and
+    flush overhead on cells with many small writes.
+    """
+    pending: list[str] = []
+
+    def flush():
+        if pending:
+            console.print("".join(pending), end="", markup=False)
+            pending.clear()
+
+    for output in outputs:
+        output_type = output.get("output_type", "")
+        if output_type == "stream":
+            text = output.get("text", "")
+            if isinstance(text, list):
+                text = "".join(text)
+            pending.append(text)
+        elif output_type in ("execute_result", "display_data"):
+            flush()
+            _print_rich_output(console, output.get("data", {}))
+        elif output_type == "error":
+            flush()
+            traceback_lines = output.get("traceback", [])
+            console.print("\n".join(traceback_lines), style="red", markup=False)
+    flush()
+
+
 def _print_last_cell_output(
-    console: Console, notebook_path: str, language: str, is_busy: bool = False
+    console: Console, nb: dict, language: str, is_busy: bool = False
 ) -> None:
     """
-    Read the notebook file and print the outputs of the last code cell
-    that has non-empty outputs, so the user sees recent output immediately
-    upon attaching.  When is_busy is True, also show the likely currently
-    executing cell.
+    Print the outputs of the last code cell that has non-empty outputs,
+    so the user sees recent output immediately upon attaching.  When
+    is_busy is True, also show the likely currently executing cell.
     """
-    try:
-        with open(notebook_path) as f:
-            nb = json.load(f)
-    except Exception:
-        return
-
+    # Scan from the end: the last cell with output is almost always within the
+    # final couple of cells, so this inspects O(1) cells instead of all of them.
     last_cell_with_output = None
-    for cell in nb.get("cells", []):
+    for cell in reversed(nb.get("cells", [])):
         # Only consider completed cells: execution_count is set only on completion.
         # Cells with outputs but no execution_count are currently executing.
         if cell.get("cell_type") == "code" and cell.get("outputs") and cell.get("execution_count"):
             last_cell_with_output = cell
+            break
 
     if last_cell_with_output is not None:
         exec_count = last_cell_with_output.get("execution_count") or "?"
         console.print(f"[dim]--- Last cell output \\[execution count: {exec_count}] ---[/dim]")
         _print_code_block(console, last_cell_with_output.get("source", ""), exec_count, language)
-        for output in last_cell_with_output["outputs"]:
-            output_type = output.get("output_type", "")
-            if output_type == "stream":
-                text = output.get("text", "")
-                if isinstance(text, list):
-                    text = "".join(text)
-                console.print(text, end="", markup=False)
-            elif output_type in ("execute_result", "display_data"):
-                _print_rich_output(console, output.get("data", {}))
-            elif output_type == "error":
-                traceback_lines = output.get("traceback", [])
-                console.print("\n".join(traceback_lines), style="red", markup=False)
+        _print_outputs(console, last_cell_with_output["outputs"])
         console.print("[dim]--- End of last cell output ---[/dim]")
 
     if is_busy:
-        executing = _find_likely_executing_cell(notebook_path)
+        executing = _find_likely_executing_cell(nb)
         if executing is not None:
             source, outputs, ec = executing
             console.print("[dim]--- Currently executing cell ---[/dim]")
             _print_code_block(console, source, "...", language)
-            for output in outputs:
-                output_type = output.get("output_type", "")
-                if output_type == "stream":
-                    text = output.get("text", "")
-                    if isinstance(text, list):
-                        text = "".join(text)
-                    console.print(text, end="", markup=False)
-                elif output_type in ("execute_result", "display_data"):
-                    _print_rich_output(console, output.get("data", {}))
-                elif output_type == "error":
-                    traceback_lines = output.get("traceback", [])
-                    console.print("\n".join(traceback_lines), style="red", markup=False)
+            _print_outputs(console, outputs)
             console.print("[dim]--- (live outputs will stream below) ---[/dim]")
 
 
+# IOPub message types the tool renders; the content of anything else (comm
+# traffic, debug events, ...) is never deserialized.
+_RENDERED_MSG_TYPES = frozenset({
+    "status",
+    "execute_input",
+    "stream",
+    "execute_result",
+    "display_data",
+    "error",
+    "clear_output",
+})
+
 # Status colors per kernel execution_state value.
 _STATE_STYLE = {
     "idle":     ("●", "bold green"),
@@ -256,6 +651,49 @@ _STATE_STYLE = {
     "starting": ("●", "bold blue"),
 }
 
+# All fill states of the progress bar, precomputed so each frame indexes two
+# tables instead of building fresh strings with multiplication.
+_BAR_WIDTH = 20
+_BARS_FILLED = ["█" * f for f in range(_BAR_WIDTH + 1)]
+_BARS_EMPTY = ["░" * (_BAR_WIDTH - f) for f in range(_BAR_WIDTH + 1)]
+
+# Parsed Style objects for the dynamic status-bar segments, built on first
+# use (keeping rich off the import path) and reused every frame so appends
+# skip the style-spec parsing.
+_STYLE_CACHE: dict[str, Style] = {}
+
+
+def _style(spec: str) -> Style:
+    from rich.style import Style
+
+    style = _STYLE_CACHE.get(spec)
+    if style is None:
+        style = _STYLE_CACHE[spec] = Style.parse(spec)
+    return style
+
+
+# The leading part of the status bar (newline + labels + state dot) is fixed
+# per kernel state, so it is assembled once per state and copied each frame
+# instead of re-running the style parsing on every render.
+_PREFIX_BY_STATE: dict[str, Text] = {}
+
+
+def _status_prefix(kernel_state: str) -> Text:
+    from rich.text import Text
+
+    prefix = _PREFIX_BY_STATE.get(kernel_state)
+    if prefix is None:
+        symbol, style = _STATE_STYLE.get(kernel_state, ("●", "bold red"))
+        prefix = Text.assemble(
+            "\n",
+            (" Kernel: ", "bold"),
+            (f"{symbol} {kernel_state}", style),
+            ("  │  ", "dim"),
+            ("Cells: ", "bold"),
+        )
+        _PREFIX_BY_STATE[kernel_state] = prefix
+    return prefix
+
 
 def _process_stream(buf: str, text: str) -> tuple[str, list[str]]:
     """
@@ -265,46 +703,36 @@ def _process_stream(buf: str, text: str) -> tuple[str, list[str]]:
     - new_buf is the current in-progress line (not yet terminated by \\n)
     - completed_lines have a trailing \\n and are ready to print
     """
+    # \r\n terminates a line like \n; a lone \r means "overwrite this line",
+    # so only what follows the last \r of each segment survives. split/rfind
+    # keep the scanning in C instead of a per-character Python loop.
+    combined = (buf + text).replace("\r\n", "\n")
+    segments = combined.split("\n")
+
     completed: list[str] = []
-    combined = buf + text
-    current = ""
-    i = 0
-    while i < len(combined):
-        ch = combined[i]
-        if ch == "\r":
-            if i + 1 < len(combined) and combined[i + 1] == "\n":
-                completed.append(current + "\n")
-                current = ""
-                i += 2
-            else:
-                current = ""  # carriage return: overwrite the current line
-                i += 1
-        elif ch == "\n":
-            completed.append(current + "\n")
-            current = ""
-            i += 1
-        else:
-            current += ch
-            i += 1
+    for segment in segments[:-1]:
+        cr = segment.rfind("\r")
+        completed.append((segment[cr + 1:] if cr != -1 else segment) + "\n")
+
+    current = segments[-1]
+    cr = current.rfind("\r")
+    if cr != -1:
+        current = current[cr + 1:]
     return current, completed
 
 
 def _make_status_bar(kernel_state: str, cells_executed: int, total_cells: int) -> Text:
-    symbol, style = _STATE_STYLE.get(kernel_state, ("●", "bold red"))
-
-    bar = Text("\n")
-    bar.append(" Kernel: ", style="bold")
-    bar.append(f"{symbol} {kernel_state}", style=style)
-    bar.append("  │  ", style="dim")
-    bar.append("Cells: ", style="bold")
+    bar = _status_prefix(kernel_state).copy()
 
     # Progress bar
-    width = 20
-    filled = int(width * cells_executed / total_cells) if total_cells else 0
-    filled = min(filled, width)
-    bar.append("█" * filled, style="bold cyan")
-    bar.append("░" * (width - filled), style="dim")
-    bar.append(f" {cells_executed}/{total_cells}", style="bold")
+    filled = (
+        min(_BAR_WIDTH, (_BAR_WIDTH * cells_executed) // total_cells)
+        if total_cells
+        else 0
+    )
+    bar.append(_BARS_FILLED[filled], style=_style("bold cyan"))
+    bar.append(_BARS_EMPTY[filled], style=_style("dim"))
+    bar.append(f" {cells_executed}/{total_cells}", style=_style("bold"))
 
     return bar
 
@@ -322,6 +750,8 @@ def main(notebook_path: str):
         click.echo("Make sure this is run in the same environment that Jupyter is installed to.")
         return
 
+    from rich.console import Console
+
     console = Console(highlight=False)
     console.print(f"Finding kernel for notebook: [bold]{notebook_path}[/bold]")
 
@@ -334,12 +764,13 @@ def main(notebook_path: str):
         return
 
     connection_file, kernel_state = result
-    total_cells, cells_executed, language = _notebook_cell_stats(notebook_path)
+    nb = _load_notebook_cached(notebook_path)
+    total_cells, cells_executed, language = _notebook_cell_stats(nb)
     if kernel_state == "busy":
         # execution_count is only written to disk on cell completion, so max_ec
         # equals completed cells. The currently executing cell is always +1.
         cells_executed += 1
-    _print_last_cell_output(console, notebook_path, language, is_busy=(kernel_state == "busy"))
+    _print_last_cell_output(console, nb, language, is_busy=(kernel_state == "busy"))
     console.print(
         "Attaching to kernel "
         "([bold]Ctrl+C[/bold] interrupt & detach, [bold]Ctrl+Z[/bold] detach only)..."
@@ -347,10 +778,31 @@ def main(notebook_path: str):
 
     import signal
 
-    class _DetachOnly(Exception):
-        pass
+    import zmq
+    from rich.console import Group
+    from rich.live import Live
+    from rich.text import Text
+
+    # Self-pipe: the signal handlers write one byte and the poller wakes up
+    # cleanly, instead of raising an exception through a blocking ZMQ recv
+    # (which made Ctrl+Z flaky on some platforms).
+    pipe_r, pipe_w = os.pipe()
+    os.set_blocking(pipe_w, False)
 
-    old_sigtstp = signal.signal(signal.SIGTSTP, lambda s, f: (_ for _ in ()).throw(_DetachOnly()))
+    def _on_sigtstp(signum, frame):
+        try:
+            os.write(pipe_w, b"T")
+        except OSError:
+            pass
+
+    def _on_sigint(signum, frame):
+        try:
+            os.write(pipe_w, b"I")
+        except OSError:
+            pass
+
+    old_sigtstp = signal.signal(signal.SIGTSTP, _on_sigtstp)
+    old_sigint = signal.signal(signal.SIGINT, _on_sigint)
 
     client = jupyter_client.BlockingKernelClient(connection_file=connection_file)
     client.load_connection_file()
@@ -365,62 +817,134 @@ def main(notebook_path: str):
         return Group(status)
 
     try:
+        poller = zmq.Poller()
+        iopub_socket = client.iopub_channel.socket
+        shell_socket = client.shell_channel.socket
+        poller.register(iopub_socket, zmq.POLLIN)
+        poller.register(shell_socket, zmq.POLLIN)
+        poller.register(pipe_r, zmq.POLLIN)
+
         with Live(
             _live_renderable(),
             console=console,
             refresh_per_second=8,
             transient=False,
         ) as live:
+            last_render = 0.0
+            dirty = False
             while True:
-                msg = client.get_iopub_msg()
-                msg_type = msg["msg_type"]
-                content = msg.get("content", {})
-
-                if msg_type == "status":
-                    kernel_state = content.get("execution_state", kernel_state)
-                    if kernel_state == "dead":
-                        console.print("[red]Kernel has been closed.[/red]")
-                        return
-
-                elif msg_type == "execute_input":
-                    # Kernel just started executing a cell; bump the counter.
-                    ec = content.get("execution_count") or 0
-                    cells_executed = max(cells_executed, ec)
-                    _print_code_block(console, content.get("code", ""), ec, language)
-
-                elif msg_type == "stream":
-                    stream_buf, completed = _process_stream(stream_buf, content["text"])
-                    for line in completed:
-                        console.print(line, end="", markup=False)
-
-                elif msg_type == "execute_result":
-                    _print_rich_output(console, content.get("data", {}))
-
-                elif msg_type == "display_data":
-                    _print_rich_output(console, content.get("data", {}))
-
-                elif msg_type == "error":
-                    console.print("\n".join(content.get("traceback", [])), style="red", markup=False)
-
-                elif msg_type == "clear_output":
-                    console.clear()
-
-                live.update(_live_renderable())
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupting kernel and detaching...[/yellow]")
-        try:
-            msg = client.session.msg("interrupt_request", {})
-            client.control_channel.send(msg)
-        except Exception as e:
-            console.print(f"[red]Warning: could not send interrupt to kernel: {e}[/red]")
-
-    except _DetachOnly:
-        console.print("\n[yellow]Detaching from kernel...[/yellow]")
+                events = dict(poller.poll(125))
+
+                if pipe_r in events:
+                    if b"I" in os.read(pipe_r, 16):
+                        console.print("\n[yellow]Interrupting kernel and detaching...[/yellow]")
+                        try:
+                            msg = client.session.msg("interrupt_request", {})
+                            client.control_channel.send(msg)
+                        except Exception as e:
+                            console.print(f"[red]Warning: could not send interrupt to kernel: {e}[/red]")
+                    else:
+                        console.print("\n[yellow]Detaching from kernel...[/yellow]")
+                    return
+
+                if shell_socket in events:
+                    # Drain shell replies so a ready shell socket doesn't spin
+                    # the poller; the tool only renders the IOPub side.
+                    while True:
+                        try:
+                            client.get_shell_msg(timeout=0)
+                        except Empty:
+                            break
+
+                if iopub_socket not in events:
+                    # Flush state a rate-capped batch processed but never
+                    # drew — e.g. a fast cell whose idle status landed within
+                    # the render window — or the bar would stay stale until
+                    # the next message, possibly forever.
+                    if dirty:
+                        live.update(_live_renderable())
+                        last_render = time.monotonic()
+                        dirty = False
+                    continue
+
+                # Drain every ready message so a burst (e.g. tqdm flooding
+                # stdout) costs a single status-bar render. Frames are taken
+                # zero-copy with the content left packed, so large payloads
+                # are only deserialized if their type is actually rendered.
+                msgs = []
+                while True:
+                    try:
+                        frames = iopub_socket.recv_multipart(zmq.NOBLOCK, copy=False)
+                    except zmq.Again:
+                        break
+                    _, msg_list = client.session.feed_identities(frames, copy=False)
+                    msgs.append(
+                        client.session.deserialize(msg_list, content=False, copy=False)
+                    )
+
+                force_render = False
+                for msg in msgs:
+                    msg_type = msg["msg_type"]
+                    if msg_type not in _RENDERED_MSG_TYPES:
+                        continue
+                    content = msg.get("content", {})
+                    if not isinstance(content, dict):
+                        content = client.session.unpack(bytes(content))
+                    if msg_type in ("execute_input", "error"):
+                        # Cell boundaries and failures should hit the screen
+                        # immediately rather than wait for the next tick.
+                        force_render = True
+
+                    if msg_type == "status":
+                        kernel_state = content.get("execution_state", kernel_state)
+                        if kernel_state == "dead":
+                            console.print("[red]Kernel has been closed.[/red]")
+                            return
+
+                    elif msg_type == "execute_input":
+                        # Kernel just started executing a cell; bump the counter.
+                        ec = content.get("execution_count") or 0
+                        cells_executed = max(cells_executed, ec)
+                        _print_code_block(console, content.get("code", ""), ec, language)
+
+                    elif msg_type == "stream":
+                        stream_buf, completed = _process_stream(stream_buf, content["text"])
+                        if completed:
+                            # One print per message, not per line: each call
+                            # pays rendering + flush, and busy cells emit many
+                            # lines per message.
+                            console.print("".join(completed), end="", markup=False)
+
+                    elif msg_type == "execute_result":
+                        _print_rich_output(console, content.get("data", {}))
+
+                    elif msg_type == "display_data":
+                        _print_rich_output(console, content.get("data", {}))
+
+                    elif msg_type == "error":
+                        console.print("\n".join(content.get("traceback", [])), style="red", markup=False)
+
+                    elif msg_type == "clear_output":
+                        console.clear()
+
+                # The poller can wake far faster than the display refreshes
+                # under a steady message trickle; cap renders at the Live
+                # refresh cadence unless something urgent arrived.
+                now = time.monotonic()
+                if force_render or now - last_render >= 0.125:
+                    live.update(_live_renderable())
+                    last_render = now
+                    dirty = False
+                else:
+                    dirty = True
 
     finally:
         signal.signal(signal.SIGTSTP, old_sigtstp)
+        signal.signal(signal.SIGINT, old_sigint)
+        os.close(pipe_r)
+        os.close(pipe_w)
         client.stop_channels()
+        _close_http_conns()
 
 
 if __name__ == "__main__":
@@ -1,21 +1,151 @@
 import os
-import shutil
 from typing import Literal
 
 import click
-import hdf5plugin
-import anndata as ad
-import scipy.sparse as sp
-import numpy as np
-import tempfile
+
+# anndata/scipy/numpy/hdf5plugin are imported inside the functions that need
+# them: together they take over a second to import, which would otherwise be
+# paid before click can even print --help.
+
+
+def _to_sparse(value):
+    """
+    Convert a dense ndarray to CSR sparse; sparse inputs and non-array values
+    (e.g. DataFrames in .obsm) pass through unchanged.  csr_array is used over
+    csr_matrix so no extra copy of the dense input is retained.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+
+    if sp.issparse(value):
+        return value
+    if isinstance(value, np.ndarray):
+        return sp.csr_array(value)
+    return value
+
+
+def _select_codec(compression: str, clevel: int, shuffle: bool):
+    """Map the CLI codec options to (compression, compression_opts) for h5py.
+
+    anndata only takes one filter for the whole file, so the codec applies to
+    every dataset rather than per-layer.
+    """
+    import hdf5plugin
+
+    if compression in ("gzip", "lzf"):
+        return compression, None  # Use built-in compression
+    if compression == "zstd":
+        # Use zstd compression via hdf5plugin
+        return hdf5plugin.FILTERS['zstd'], hdf5plugin.Zstd(clevel=clevel).filter_options
+    # blosc2 around zstd; bitshuffle clusters correlated bits so count
+    # matrices compress smaller and decode (SIMD-parallel) faster.
+    return hdf5plugin.FILTERS['blosc2'], hdf5plugin.Blosc2(
+        cname='zstd',
+        clevel=clevel,
+        filters=hdf5plugin.Blosc2.BITSHUFFLE if shuffle else hdf5plugin.Blosc2.NOFILTER,
+    ).filter_options
+
+
+def _recompress_h5(input_file: str, output_file: str, h5_compression, h5_opts,
+                   numeric_only=False, clevel: int = 5,
+                   block_rows: int = 10000) -> None:
+    """
+    Stream-copy an HDF5 file, rewriting every dataset with the target
+    compression in slabs along the first axis.  Peak memory is one slab
+    instead of the whole dataset, so files larger than RAM can be
+    recompressed; groups and attributes are copied verbatim, which preserves
+    the AnnData layout (including the CSR component arrays of sparse
+    matrices).  With numeric_only, non-numeric datasets fall back to plain
+    zstd: blosc2/bitshuffle assume a fixed element size and crash the process
+    on the variable-length string datasets every .h5ad contains.
+    """
+    import h5py
+
+    fallback = _select_codec('zstd', clevel, False) if numeric_only else None
+
+    def copy_attrs(src, dst):
+        for name, value in src.attrs.items():
+            dst.attrs[name] = value
+
+    def copy_group(src_group, dst_group):
+        copy_attrs(src_group, dst_group)
+        for name, obj in src_group.items():
+            if isinstance(obj, h5py.Group):
+                copy_group(obj, dst_group.create_group(name))
+                continue
+
+            if obj.shape == () or obj.size == 0:
+                # Scalar/empty datasets cannot be chunked or compressed.
+                new = dst_group.create_dataset(name, data=obj[()], dtype=obj.dtype)
+            else:
+                compression, opts = h5_compression, h5_opts
+                if fallback is not None and obj.dtype.kind not in 'biufc':
+                    compression, opts = fallback
+                kwargs = {}
+                if opts is not None:
+                    kwargs['compression_opts'] = opts
+                new = dst_group.create_dataset(
+                    name, shape=obj.shape, dtype=obj.dtype,
+                    chunks=True, compression=compression, **kwargs,
+                )
+                for start in range(0, obj.shape[0], block_rows):
+                    stop = min(obj.shape[0], start + block_rows)
+                    new[start:stop] = obj[start:stop]
+            copy_attrs(obj, new)
+
+    with h5py.File(input_file, 'r') as src, h5py.File(output_file, 'w') as dst:
+        copy_group(src, dst)
 
 
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.argument('output_file', type=click.Path(), required=False)
-@click.option('--compression', type=click.Choice(['gzip', 'lzf', 'zstd']), default='zstd',
-              help='Compression algorithm to use for the output .h5ad file.')
-def main(input_file: str, output_file: str = None, compression: Literal["gzip", "lzf", "zstd"] = "gzip"):
+@click.option('--compression', type=click.Choice(['gzip', 'lzf', 'zstd', 'blosc2']), default='zstd',
+              help='Compression algorithm to use for the output .h5ad file. '
+                   'blosc2 wraps zstd and supports bitshuffle, which packs '
+                   'integer count matrices tighter and decodes faster; it '
+                   'only works with --low-memory.')
+@click.option('--clevel', default=5, show_default=True,
+              help='Compression level for zstd/blosc2.')
+@click.option('--shuffle/--no-shuffle', default=True, show_default=True,
+              help='Apply bitshuffle before blosc2 compression.')
+@click.option('--low-memory', is_flag=True, default=False,
+              help='Stream-recompress the file in chunks instead of loading '
+                   'it into RAM. Handles files larger than memory, but skips '
+                   'the dense-to-sparse conversion.')
+def main(input_file: str, output_file: str = None,
+         compression: Literal["gzip", "lzf", "zstd", "blosc2"] = "zstd",
+         clevel: int = 5, shuffle: bool = True, low_memory: bool = False):
+    destination = output_file if output_file else input_file
+
+    # blosc2 needs the per-dataset fallback below: anndata's write_h5ad
+    # applies one filter to every dataset, and blosc2/bitshuffle cannot
+    # encode the variable-length string datasets (obs/var index) in an .h5ad.
+    if compression == 'blosc2' and not low_memory:
+        raise click.UsageError('--compression blosc2 requires --low-memory.')
+
+    h5_compression, h5_opts = _select_codec(compression, clevel, shuffle)
+
+    if low_memory:
+        click.echo(
+            f"Streaming recompression of {input_file} with {compression} compression..."
+        )
+        temp_output_file = f"{destination}.tmp-{os.getpid()}"
+        try:
+            _recompress_h5(input_file, temp_output_file, h5_compression, h5_opts,
+                           numeric_only=(compression == 'blosc2'), clevel=clevel)
+            os.replace(temp_output_file, destination)
+        except BaseException:
+            if os.path.exists(temp_output_file):
+                os.unlink(temp_output_file)
+            raise
+        click.echo(
+            f"Compression completed, h5ad file saved to: {destination}"
+        )
+        return
+
+    import anndata as ad
+
     adata = ad.read_h5ad(input_file)  # Read the input .h5ad file
 
     # for each layer, if not a sparse matrix, convert to sparse
@@ -23,58 +153,42 @@ def main(input_file: str, output_file: str = None, compression: Literal["gzip",
         "Converting dense matrices to sparse..."
     )
 
-    # Check main matrix
-    if not sp.issparse(adata.X):
-        adata.X = sp.csr_matrix(adata.X)
-    # Check layers
-    for layer in adata.layers:
-        if not sp.issparse(adata.layers[layer]):
-            adata.layers[layer] = sp.csr_matrix(adata.layers[layer])
-    # Check obsm
-    for key in adata.obsm:
-        if not sp.issparse(adata.obsm[key]) and isinstance(adata.obsm[key], np.ndarray):
-            adata.obsm[key] = sp.csr_matrix(adata.obsm[key])
-    # Check varm
-    for key in adata.varm:
-        if not sp.issparse(adata.varm[key]) and isinstance(adata.varm[key], np.ndarray):
-            adata.varm[key] = sp.csr_matrix(adata.varm[key])
-    # Check obsp
-    for key in adata.obsp:
-        if not sp.issparse(adata.obsp[key]):
-            adata.obsp[key] = sp.csr_matrix(adata.obsp[key])
-    # Check varp
-    for key in adata.varp:
-        if not sp.issparse(adata.varp[key]):
-            adata.varp[key] = sp.csr_matrix(adata.varp[key])
-    # Check .raw
+    # Check main matrix, then every mapping that can hold matrices
+    adata.X = _to_sparse(adata.X)
+    for mapping_name in ('layers', 'obsm', 'varm', 'obsp', 'varp'):
+        mapping = getattr(adata, mapping_name)
+        for key in list(mapping):
+            mapping[key] = _to_sparse(mapping[key])
+    # Check .raw; Raw.X is a read-only property, so when it holds a dense
+    # matrix the whole .raw has to be rebuilt around the sparse conversion.
     if adata.raw is not None:
+        import scipy.sparse as sp
+
         if not sp.issparse(adata.raw.X):
-            adata.raw.X = sp.csr_matrix(adata.raw.X)
+            raw = adata.raw.to_adata()
+            raw.X = _to_sparse(raw.X)
+            adata.raw = raw
 
     # Finally, write the output .h5ad file with compression
     click.echo(
-        f"Writing compressed .h5ad file to {output_file} with {compression} compression..."
+        f"Writing compressed .h5ad file to {destination} with {compression} compression..."
     )
 
-    is_same = output_file is None or (input_file == output_file)
-    with tempfile.NamedTemporaryFile() as tmp_file:
-        temp_output_file = tmp_file.name if is_same else output_file
-        if compression != "zstd":
-            adata.write_h5ad(temp_output_file, compression=compression)  # Use built-in compression
-        else:
-            # Use zstd compression via hdf5plugin
-            adata.write_h5ad(temp_output_file,
-                             compression=hdf5plugin.FILTERS['zstd'],
-                             compression_opts=hdf5plugin.Zstd(clevel=5).filter_options
-                             )
-
-        # If overwriting, move temp file to original location
-        if is_same:
-            os.remove(input_file)
-            shutil.copy(temp_output_file, input_file)
+    # Write to a sibling temp file and atomically rename into place: the
+    # rename moves a directory entry instead of re-copying gigabytes, and a
+    # failed run never clobbers the destination (or the input, when
+    # overwriting in place).
+    temp_output_file = f"{destination}.tmp-{os.getpid()}"
+    try:
+        adata.write_h5ad(temp_output_file, compression=h5_compression, compression_opts=h5_opts)
+        os.replace(temp_output_file, destination)
+    except BaseException:
+        if os.path.exists(temp_output_file):
+            os.unlink(temp_output_file)
+        raise
 
     click.echo(
-        f"Compression completed, h5ad file saved to: {output_file if output_file else input_file}"
+        f"Compression completed, h5ad file saved to: {destination}"
     )
 
 